@@ -17,6 +17,10 @@ SECRET_KEY = os.getenv("BETTER_AUTH_SECRET", "your-super-secret-jwt-key-here-mak
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 7 * 24 * 60  # 7 days
 
+# PBKDF2 work factor; tests override this to a tiny value since each hash at
+# the production setting costs tens of milliseconds of pure CPU
+PBKDF2_ITERATIONS = int(os.getenv("PBKDF2_ITERATIONS", "100000"))
+
 
 # Password hashing using hashlib and secrets (simple but secure alternative to bcrypt)
 def hash_password(password: str) -> str:
@@ -28,7 +32,7 @@ def hash_password(password: str) -> str:
     # Generate a random salt
     salt = secrets.token_hex(32)
     # Hash the password with the salt
-    pwdhash = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt.encode('utf-8'), 100000)
+    pwdhash = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt.encode('utf-8'), PBKDF2_ITERATIONS)
     # Combine salt and hash
     pwd_hash = salt + pwdhash.hex()
     return pwd_hash
@@ -45,7 +49,7 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         plain_password = plain_password[:72]
 
     # Hash the plain password with the extracted salt
-    pwdhash = hashlib.pbkdf2_hmac('sha256', plain_password.encode('utf-8'), salt.encode('utf-8'), 100000)
+    pwdhash = hashlib.pbkdf2_hmac('sha256', plain_password.encode('utf-8'), salt.encode('utf-8'), PBKDF2_ITERATIONS)
     computed_hash = pwdhash.hex()
 
     # Compare the hashes
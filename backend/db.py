@@ -38,15 +38,41 @@ DATABASE_URL = setup_ssl_verification(DATABASE_URL)
 
 # Create engine with connection pooling settings appropriate for async applications
 try:
-    engine = create_engine(
-        DATABASE_URL,
-        pool_size=5,  # Base number of connections
-        max_overflow=10,  # Additional connections beyond pool_size
-        pool_pre_ping=True,  # Verify connections before use
-        pool_recycle=300,  # Recycle connections after 5 minutes
-        echo=True  # Enable SQL logging for debugging
-    )
-    print(f"Database engine created with URL: {DATABASE_URL}")
+    if os.getenv("TESTING"):
+        # Under pytest, use an in-memory SQLite database on a StaticPool so
+        # every session shares the single in-RAM connection and commits skip
+        # disk fsync entirely
+        from sqlalchemy.pool import StaticPool
+
+        engine = create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+
+        # pysqlite's implicit transaction handling issues COMMITs of its
+        # own around savepoint statements, which silently defeats the test
+        # suite's rollback isolation. Take over BEGIN emission so SAVEPOINT
+        # and RELEASE nest the way SQLAlchemy expects.
+        @event.listens_for(engine, "connect")
+        def _pysqlite_no_autobegin(dbapi_connection, connection_record):
+            dbapi_connection.isolation_level = None
+
+        @event.listens_for(engine, "begin")
+        def _pysqlite_emit_begin(conn):
+            conn.exec_driver_sql("BEGIN")
+
+        print("Database engine created with in-memory SQLite (TESTING mode)")
+    else:
+        engine = create_engine(
+            DATABASE_URL,
+            pool_size=5,  # Base number of connections
+            max_overflow=10,  # Additional connections beyond pool_size
+            pool_pre_ping=True,  # Verify connections before use
+            pool_recycle=300,  # Recycle connections after 5 minutes
+            echo=True  # Enable SQL logging for debugging
+        )
+        print(f"Database engine created with URL: {DATABASE_URL}")
 except Exception as e:
     print(f"Error creating database engine: {e}")
     raise
@@ -84,6 +110,16 @@ def set_database_defaults(dbapi_connection, connection_record):
         # SQLite-specific setup
         cursor = dbapi_connection.cursor()
         cursor.execute("PRAGMA foreign_keys=ON")  # Enable foreign key constraints
+        # WAL avoids a full journal rewrite per commit on the on-disk dev DB
+        # (a no-op for in-memory databases, which report journal_mode=memory)
+        cursor.execute("PRAGMA journal_mode=WAL")
+        if os.getenv("TESTING"):
+            # Test databases are disposable: skip fsync and keep temp B-trees
+            # in RAM so commits run at memory speed
+            cursor.execute("PRAGMA synchronous=OFF")
+            cursor.execute("PRAGMA temp_store=MEMORY")
+        else:
+            cursor.execute("PRAGMA synchronous=NORMAL")  # Safe pairing with WAL
         cursor.close()
     else:
         # PostgreSQL-specific setup
@@ -17,6 +17,10 @@ from models import User, Task
 # Import rate limiter
 from ai_chatbot.services.rate_limiter import rate_limiter_service
 
+# Import Dapr sidecar clients so their pooled connections can be closed on shutdown
+from utils.events import dapr_publisher
+from utils.state import dapr_state_store
+
 # Import Dapr event handling utilities
 import json
 from typing import List, Dict, Any
@@ -28,7 +32,12 @@ async def lifespan(app: FastAPI):
     create_db_and_tables()
     # Initialize rate limiter
     rate_limiter_service.init_app(app)
+    # Start the background Dapr event publish worker
+    dapr_publisher.start_worker()
     yield
+    # Close the pooled Dapr sidecar clients
+    await dapr_publisher.aclose()
+    await dapr_state_store.aclose()
 
 
 # Security scheme for Swagger UI
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlmodel import Session, select
-from typing import List, Optional
-from pydantic import BaseModel
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel, ValidationError
 import uuid
 from auth import get_current_user_id
 from models import Task, User
@@ -18,6 +18,7 @@ from services.task_service import (
 
 # Import Dapr event publishing utilities
 from utils.events import (
+    EventBatch,
     publish_task_created_event,
     publish_task_updated_event,
     publish_task_deleted_event,
@@ -73,11 +74,48 @@ class TaskListResponse(BaseModel):
     tasks: List[TaskResponse]
 
 
+class TaskBatchOperation(BaseModel):
+    op: str  # create, update, complete, delete
+    task_id: Optional[uuid.UUID] = None  # defaults to the batch's last created task
+    data: Dict[str, Any] = {}
+
+
+class TaskBatchResponse(BaseModel):
+    results: List[Dict[str, Any]]
+
+
 class ErrorResponse(BaseModel):
     error: str
     details: List[str] = None
 
 
+def _task_update_error(task_update: TaskUpdate) -> Optional[str]:
+    """Return the first semantic validation error for an update, if any.
+
+    Shared by the PUT route and the batch update branch so both enforce
+    the same rules beyond what the TaskUpdate model itself checks.
+    """
+    if task_update.title is not None:
+        if not task_update.title.strip():
+            return "Title is required"
+        if len(task_update.title) > 200:
+            return "Title too long"
+    if task_update.description is not None and len(task_update.description) > 1000:
+        return "Description too long"
+    if task_update.priority is not None and task_update.priority not in ["low", "medium", "high"]:
+        return "Priority must be 'low', 'medium', or 'high'"
+    return None
+
+
+def _updated_fields(task_update: TaskUpdate) -> Dict[str, Any]:
+    """Collect the fields an update actually set, for the task.updated event."""
+    return {
+        field: value
+        for field, value in task_update.model_dump().items()
+        if value is not None
+    }
+
+
 @router.get("/", response_model=TaskListResponse)
 def get_tasks(
     current_user_id: uuid.UUID = Depends(get_current_user_id),
@@ -200,31 +238,12 @@ def get_task_by_id(task_id: uuid.UUID, current_user_id: uuid.UUID = Depends(get_
 @router.put("/{task_id}", response_model=TaskResponse)
 async def update_task(task_id: uuid.UUID, task_update: TaskUpdate, current_user_id: uuid.UUID = Depends(get_current_user_id), session: Session = Depends(get_session)):
     """Update a specific task."""
-    # Validate input if title is being updated
-    if task_update.title is not None:
-        if not task_update.title.strip():
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Title is required"
-            )
-
-        if len(task_update.title) > 200:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Title too long"
-            )
-
-    if task_update.description is not None and len(task_update.description) > 1000:
+    # Validate input beyond the model's type checks
+    error = _task_update_error(task_update)
+    if error is not None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Description too long"
-        )
-
-    # Validate priority if provided
-    if task_update.priority is not None and task_update.priority not in ["low", "medium", "high"]:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Priority must be 'low', 'medium', or 'high'"
+            detail=error
         )
 
     # Update the task using the service layer which ensures user isolation
@@ -248,23 +267,11 @@ async def update_task(task_id: uuid.UUID, task_update: TaskUpdate, current_user_
         )
 
     # Prepare updated fields for event
-    updated_fields = {}
-    if task_update.title is not None:
-        updated_fields['title'] = task_update.title
-    if task_update.description is not None:
-        updated_fields['description'] = task_update.description
-    if task_update.completed is not None:
-        updated_fields['completed'] = task_update.completed
-    if task_update.priority is not None:
-        updated_fields['priority'] = task_update.priority
-    if task_update.category is not None:
-        updated_fields['category'] = task_update.category
-    if task_update.due_date is not None:
-        updated_fields['due_date'] = task_update.due_date
-    if task_update.recurrence_pattern is not None:
-        updated_fields['recurrence_pattern'] = task_update.recurrence_pattern
-
-    # Publish task updated event to Dapr pub/sub
+    updated_fields = _updated_fields(task_update)
+
+    # Publish task updated event to Dapr pub/sub; completion toggles keep
+    # their own event on the PATCH /complete path only, so subscribers never
+    # see two task.completed events for one state change
     await publish_task_updated_event(str(task_id), str(current_user_id), updated_fields)
 
     return updated_task
@@ -297,6 +304,112 @@ async def delete_task(task_id: uuid.UUID, current_user_id: uuid.UUID = Depends(g
     return
 
 
+@router.post("/batch", response_model=TaskBatchResponse)
+async def batch_tasks(operations: List[TaskBatchOperation], current_user_id: uuid.UUID = Depends(get_current_user_id), session: Session = Depends(get_session)):
+    """Apply several task operations in a single request.
+
+    Collapses a create/update/complete/delete sequence into one round trip;
+    operations after a create may omit task_id to target the task created
+    earlier in the same batch. All resulting events flush in one batch.
+    """
+    results = []
+    last_created_id: Optional[uuid.UUID] = None
+
+    async with EventBatch() as batch:
+        for operation in operations:
+            target_id = operation.task_id or last_created_id
+
+            if operation.op == "create":
+                try:
+                    task_data = TaskCreate(**operation.data)
+                except ValidationError as e:
+                    results.append({"error": f"Invalid create data: {e.errors()[0]['msg']}"})
+                    continue
+                if not task_data.title.strip():
+                    results.append({"error": "Title is required"})
+                    continue
+                db_task = create_task_for_user(
+                    session,
+                    current_user_id,
+                    task_data.title,
+                    task_data.description,
+                    task_data.priority,
+                    task_data.category,
+                    task_data.due_date,
+                    task_data.recurrence_pattern
+                )
+                last_created_id = db_task.id
+                batch.add("task.created", {
+                    "task_id": str(db_task.id),
+                    "user_id": str(current_user_id),
+                    "title": db_task.title,
+                    "description": db_task.description
+                }, "task.created")
+                results.append(TaskResponse.model_validate(db_task).model_dump(mode="json"))
+
+            elif operation.op == "update":
+                try:
+                    task_update = TaskUpdate(**operation.data)
+                except ValidationError as e:
+                    results.append({"error": f"Invalid update data: {e.errors()[0]['msg']}"})
+                    continue
+                # Same semantic checks the PUT route applies
+                error = _task_update_error(task_update)
+                if error is not None:
+                    results.append({"error": error})
+                    continue
+                updated_task = update_task_for_user(
+                    session,
+                    target_id,
+                    current_user_id,
+                    title=task_update.title,
+                    description=task_update.description,
+                    completed=task_update.completed,
+                    priority=task_update.priority,
+                    category=task_update.category,
+                    due_date=task_update.due_date,
+                    recurrence_pattern=task_update.recurrence_pattern
+                )
+                if not updated_task:
+                    results.append({"error": "Task not found"})
+                    continue
+                batch.add("task.updated", {
+                    "task_id": str(target_id),
+                    "user_id": str(current_user_id),
+                    "updated_fields": _updated_fields(task_update)
+                }, "task.updated")
+                results.append(TaskResponse.model_validate(updated_task).model_dump(mode="json"))
+
+            elif operation.op == "complete":
+                completed = bool(operation.data.get("completed", True))
+                updated_task = toggle_task_completion(session, target_id, current_user_id, completed)
+                if not updated_task:
+                    results.append({"error": "Task not found"})
+                    continue
+                batch.add("task.completed", {
+                    "task_id": str(target_id),
+                    "user_id": str(current_user_id),
+                    "completed": completed
+                }, "task.completed")
+                results.append(TaskResponse.model_validate(updated_task).model_dump(mode="json"))
+
+            elif operation.op == "delete":
+                success = delete_task_for_user(session, target_id, current_user_id)
+                if not success:
+                    results.append({"error": "Task not found"})
+                    continue
+                batch.add("task.deleted", {
+                    "task_id": str(target_id),
+                    "user_id": str(current_user_id)
+                }, "task.deleted")
+                results.append({"deleted": str(target_id)})
+
+            else:
+                results.append({"error": f"Unknown operation '{operation.op}'"})
+
+    return TaskBatchResponse(results=results)
+
+
 @router.patch("/{task_id}/complete", response_model=TaskResponse)
 async def patch_task_completion(task_id: uuid.UUID, task_complete: TaskComplete, current_user_id: uuid.UUID = Depends(get_current_user_id), session: Session = Depends(get_session)):
     """Toggle task completion status."""
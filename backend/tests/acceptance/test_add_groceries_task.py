@@ -1,14 +1,12 @@
 import pytest
 from fastapi.testclient import TestClient
-from unittest.mock import patch, MagicMock
-from main import app
-from ai_chatbot.models.command import NaturalLanguageCommand, IntentType
+from unittest.mock import patch
 from ai_chatbot.models.responses import ChatResponse
 import uuid
 
 
 @pytest.fixture
-def client():
+def client(app):
     with TestClient(app) as test_client:
         yield test_client
 
@@ -30,7 +28,7 @@ def test_add_groceries_task_scenario(client):
         "password": test_password
     })
 
-    assert register_response.status_code in [200, 409]  # 200 if new user, 409 if already exists
+    assert register_response.status_code in [201, 409]  # 201 if new user, 409 if already exists
 
     # Login to get token
     login_response = client.post("/api/auth/login", json={
@@ -40,12 +38,12 @@ def test_add_groceries_task_scenario(client):
 
     assert login_response.status_code == 200
     token_data = login_response.json()
-    auth_token = token_data["access_token"]
+    auth_token = token_data["token"]
 
     # Mock the AI chatbot components to ensure they respond correctly
     with patch('ai_chatbot.orchestrator.workflow.chat_processing_workflow') as mock_workflow:
         # Configure the mock to return a successful response for the groceries task
-        mock_response = ChatResponse(
+        mock_response = ChatResponse.model_construct(
             conversation_id=str(uuid.uuid4()),
             response="I've created the task: 'Buy groceries'",
             intent="CREATE_TASK",
@@ -90,7 +88,7 @@ def test_add_groceries_task_scenario_alternative_phrasing(client):
             "email": test_email,
             "password": test_password
         })
-        assert register_response.status_code in [200, 409]
+        assert register_response.status_code in [201, 409]
 
         login_response = client.post("/api/auth/login", json={
             "email": test_email,
@@ -99,12 +97,12 @@ def test_add_groceries_task_scenario_alternative_phrasing(client):
 
     assert login_response.status_code == 200
     token_data = login_response.json()
-    auth_token = token_data["access_token"]
+    auth_token = token_data["token"]
 
     # Mock the AI chatbot components
     with patch('ai_chatbot.orchestrator.workflow.chat_processing_workflow') as mock_workflow:
         # Configure the mock to return a successful response
-        mock_response = ChatResponse(
+        mock_response = ChatResponse.model_construct(
             conversation_id=str(uuid.uuid4()),
             response="I've created the task: 'Buy groceries'",
             intent="CREATE_TASK",
@@ -146,7 +144,7 @@ def test_add_groceries_task_integration(client):
         "password": test_password
     })
 
-    assert register_response.status_code in [200, 409]  # 200 if new user, 409 if already exists
+    assert register_response.status_code in [201, 409]  # 201 if new user, 409 if already exists
 
     # Login to get token
     login_response = client.post("/api/auth/login", json={
@@ -156,7 +154,7 @@ def test_add_groceries_task_integration(client):
 
     assert login_response.status_code == 200
     token_data = login_response.json()
-    auth_token = token_data["access_token"]
+    auth_token = token_data["token"]
 
     # Make the request to the chat endpoint with the groceries command
     headers = {"Authorization": f"Bearer {auth_token}"}
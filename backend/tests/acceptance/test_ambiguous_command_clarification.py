@@ -2,20 +2,17 @@
 Acceptance test for ambiguous command clarification scenario
 Tests that the chatbot properly handles ambiguous commands by requesting clarification
 """
-import pytest
 from unittest.mock import AsyncMock, patch
 from fastapi.testclient import TestClient
-from fastapi import HTTPException
 
-from ai_chatbot.main import app
-from ai_chatbot.services.auth_validator import validate_auth_token
-from ai_chatbot.services.phase2_client import phase2_client
-from ai_chatbot.services.conversation_state import conversation_state_manager
-from ai_chatbot.services.clarification_generator import clarification_generator
-from ai_chatbot.models.command import NaturalLanguageCommand, IntentType
+import pytest
+
+# Skip at collection when the chatbot's service stack can't import (same
+# boundary as the ai_app fixture, which these tests all depend on)
+phase2_client = pytest.importorskip("ai_chatbot.services.phase2_client", exc_type=ImportError).phase2_client
 
 
-def test_ambiguous_command_clarification_scenario():
+def test_ambiguous_command_clarification_scenario(ai_app):
     """
     Acceptance Test: Ambiguous Command Clarification
 
@@ -23,7 +20,7 @@ def test_ambiguous_command_clarification_scenario():
     When: user says something ambiguous like "Complete the task"
     Then: the chatbot asks for clarification to identify the specific task
     """
-    client = TestClient(app)
+    client = TestClient(ai_app)
 
     # Mock authentication validation
     mock_user_id = "test-user-123"
@@ -80,7 +77,7 @@ def test_ambiguous_command_clarification_scenario():
                 # (though this might vary depending on exact implementation)
 
 
-def test_multiple_matching_tasks_clarification():
+def test_multiple_matching_tasks_clarification(ai_app):
     """
     Acceptance Test: Multiple Matching Tasks Clarification
 
@@ -88,7 +85,7 @@ def test_multiple_matching_tasks_clarification():
     When: user says something that matches multiple tasks like "Update task with 'project'"
     Then: the chatbot asks for clarification between the matching tasks
     """
-    client = TestClient(app)
+    client = TestClient(ai_app)
 
     # Mock authentication validation
     mock_user_id = "test-user-456"
@@ -2,19 +2,17 @@
 Acceptance test for multi-intent command scenario
 Tests that the chatbot properly handles commands with multiple intents in a single message
 """
-import pytest
 from unittest.mock import AsyncMock, patch
 from fastapi.testclient import TestClient
-from fastapi import HTTPException
 
-from ai_chatbot.main import app
-from ai_chatbot.services.auth_validator import validate_auth_token
-from ai_chatbot.services.phase2_client import phase2_client
-from ai_chatbot.orchestrator.multi_intent import multi_intent_processor
-from ai_chatbot.models.command import NaturalLanguageCommand, IntentType
+import pytest
+
+# Skip at collection when the chatbot's service stack can't import (same
+# boundary as the ai_app fixture, which these tests all depend on)
+phase2_client = pytest.importorskip("ai_chatbot.services.phase2_client", exc_type=ImportError).phase2_client
 
 
-def test_multi_intent_command_scenario():
+def test_multi_intent_command_scenario(ai_app):
     """
     Acceptance Test: Multi-Intent Command
 
@@ -22,7 +20,7 @@ def test_multi_intent_command_scenario():
     When: user says something with multiple intents like "Add a task to buy groceries and complete my meeting prep task"
     Then: the chatbot processes both intents and executes both actions
     """
-    client = TestClient(app)
+    client = TestClient(ai_app)
 
     # Mock authentication validation
     mock_user_id = "test-user-123"
@@ -74,7 +72,7 @@ def test_multi_intent_command_scenario():
                 assert response_data["success"] is True
 
 
-def test_complex_multi_intent_scenario():
+def test_complex_multi_intent_scenario(ai_app):
     """
     Acceptance Test: Complex Multi-Intent Command
 
@@ -82,7 +80,7 @@ def test_complex_multi_intent_scenario():
     When: user says something with multiple complex intents like "Show my tasks, add a new one called 'call mom', and delete the old one"
     Then: the chatbot processes all intents in sequence and executes all actions
     """
-    client = TestClient(app)
+    client = TestClient(ai_app)
 
     # Mock authentication validation
     mock_user_id = "test-user-456"
@@ -134,7 +132,7 @@ def test_complex_multi_intent_scenario():
                 assert len(response_data["suggestions"]) > 0
 
 
-def test_multi_intent_with_semicolon_separation():
+def test_multi_intent_with_semicolon_separation(ai_app):
     """
     Acceptance Test: Multi-Intent Command with Semicolon Separation
 
@@ -142,7 +140,7 @@ def test_multi_intent_with_semicolon_separation():
     When: user says something with multiple intents separated by semicolons
     Then: the chatbot processes all intents separately
     """
-    client = TestClient(app)
+    client = TestClient(ai_app)
 
     # Mock authentication validation
     mock_user_id = "test-user-789"
@@ -1,131 +1,97 @@
 import pytest
 from fastapi.testclient import TestClient
-from unittest.mock import patch, MagicMock
-from main import app
-from ai_chatbot.models.command import NaturalLanguageCommand, IntentType
+from unittest.mock import patch
 from ai_chatbot.models.responses import ChatResponse
 import uuid
 
 
 @pytest.fixture
-def client():
+def client(app):
     with TestClient(app) as test_client:
         yield test_client
 
 
-def test_sort_tasks_by_title_scenario(client):
-    """
-    Acceptance test for "Sort tasks by title" scenario
-    """
-    # Register a test user first
-    test_email = "test_sort_title_user@example.com"
-    test_password = "SecurePassword123!"
+# Tokens already minted for a test user this session, keyed by email
+_token_cache = {}
 
-    # Clean up any existing user first
-    # Note: In a real implementation, you'd have a way to clean up test users
 
-    # Register the user
-    register_response = client.post("/api/auth/register", json={
-        "email": test_email,
-        "password": test_password
-    })
+def ensure_user(client, email, password):
+    """Register (idempotent) and log in exactly once per email, caching the token."""
+    token = _token_cache.get(email)
+    if token is None:
+        register_response = client.post("/api/auth/register", json={
+            "email": email,
+            "password": password
+        })
+        assert register_response.status_code in [201, 409]  # 201 if new user, 409 if already exists
 
-    assert register_response.status_code in [200, 409]  # 200 if new user, 409 if already exists
+        login_response = client.post("/api/auth/login", json={
+            "email": email,
+            "password": password
+        })
+        assert login_response.status_code == 200
+        token = login_response.json()["token"]
+        _token_cache[email] = token
+    return token
 
-    # Login to get token
-    login_response = client.post("/api/auth/login", json={
-        "email": test_email,
-        "password": test_password
-    })
 
-    assert login_response.status_code == 200
-    token_data = login_response.json()
-    auth_token = token_data["access_token"]
+def _assert_sorted_by_title(response_data):
+    assert "sorted" in response_data["response"].lower()
+    assert response_data["intent"] == "SORT_TASKS"
+    assert "title" in str(response_data["entities"]).lower()
 
-    # Mock the AI chatbot components to ensure they respond correctly for sorting
-    with patch('ai_chatbot.orchestrator.workflow.chat_processing_workflow') as mock_workflow:
-        # Configure the mock to return a successful response for the title sort
-        mock_response = ChatResponse(
+
+def _assert_sorted_alternative_phrasing(response_data):
+    assert "sorted" in response_data["response"].lower() or "alphabetically" in response_data["response"].lower()
+    assert response_data["intent"] == "SORT_TASKS"
+
+
+@pytest.mark.parametrize("message,mock_response,assert_fn", [
+    (
+        "Sort tasks by title",
+        ChatResponse.model_construct(
             conversation_id=str(uuid.uuid4()),
             response="I found 3 tasks sorted by title: 'Buy groceries', 'Clean house', 'Work on project'",
             intent="SORT_TASKS",
             entities={"sort_by": "title", "sort_order": "asc"},
             suggestions=["Show tasks sorted differently", "Show all tasks without sorting", "Add a new task"]
-        )
-
-        mock_workflow.process_chat_message.return_value = mock_response
-
-        # Make the request to the chat endpoint with the sort command
-        headers = {"Authorization": f"Bearer {auth_token}"}
-        chat_response = client.post("/api/chat",
-                                  json={"message": "Sort tasks by title"},
-                                  headers=headers)
-
-        # Assert the response is successful
-        assert chat_response.status_code == 200
-
-        response_data = chat_response.json()
-        assert "sorted" in response_data["response"].lower()
-        assert response_data["intent"] == "SORT_TASKS"
-        assert "title" in str(response_data["entities"]).lower()
-
-
-def test_sort_tasks_by_title_scenario_alternative_phrasing(client):
-    """
-    Acceptance test for alternative phrasing of "Sort tasks by title" scenario
-    """
-    # Register a test user first
-    test_email = "test_sort_title_alt_user@example.com"
-    test_password = "SecurePassword123!"
-
-    # Login to get token
-    login_response = client.post("/api/auth/login", json={
-        "email": test_email,
-        "password": test_password
-    })
-
-    # If login fails, try registering first
-    if login_response.status_code != 200:
-        register_response = client.post("/api/auth/register", json={
-            "email": test_email,
-            "password": test_password
-        })
-        assert register_response.status_code in [200, 409]
-
-        login_response = client.post("/api/auth/login", json={
-            "email": test_email,
-            "password": test_password
-        })
-
-    assert login_response.status_code == 200
-    token_data = login_response.json()
-    auth_token = token_data["access_token"]
-
-    # Mock the AI chatbot components
-    with patch('ai_chatbot.orchestrator.workflow.chat_processing_workflow') as mock_workflow:
-        # Configure the mock to return a successful response for the title sort
-        mock_response = ChatResponse(
+        ),
+        _assert_sorted_by_title,
+    ),
+    (
+        "Order my tasks alphabetically by name",
+        ChatResponse.model_construct(
             conversation_id=str(uuid.uuid4()),
             response="I found 2 tasks sorted by title: 'Answer emails', 'Prepare presentation'",
             intent="SORT_TASKS",
             entities={"sort": "title"},
             suggestions=[]
-        )
+        ),
+        _assert_sorted_alternative_phrasing,
+    ),
+], ids=["direct_phrasing", "alternative_phrasing"])
+def test_sort_tasks_by_title_scenario(client, message, mock_response, assert_fn):
+    """
+    Acceptance test for "Sort tasks by title" scenario, covering both the
+    direct command and an alternative phrasing
+    """
+    # Ensure the test user exists and grab a token (one register + one login)
+    auth_token = ensure_user(client, "test_sort_title_user@example.com", "SecurePassword123!")
 
+    # Mock the AI chatbot components to ensure they respond correctly for sorting
+    with patch('ai_chatbot.orchestrator.workflow.chat_processing_workflow') as mock_workflow:
         mock_workflow.process_chat_message.return_value = mock_response
 
-        # Test alternative phrasing
+        # Make the request to the chat endpoint with the sort command
         headers = {"Authorization": f"Bearer {auth_token}"}
         chat_response = client.post("/api/chat",
-                                  json={"message": "Order my tasks alphabetically by name"},
+                                  json={"message": message},
                                   headers=headers)
 
         # Assert the response is successful
         assert chat_response.status_code == 200
 
-        response_data = chat_response.json()
-        assert "sorted" in response_data["response"].lower() or "alphabetically" in response_data["response"].lower()
-        assert response_data["intent"] == "SORT_TASKS"
+        assert_fn(chat_response.json())
 
 
 def test_sort_tasks_by_title_integration(client):
@@ -135,28 +101,8 @@ def test_sort_tasks_by_title_integration(client):
     # This test assumes the AI chatbot components are working properly
     # and tests the actual API endpoint without mocking
 
-    # Register a test user first
-    test_email = "test_sort_title_integration@example.com"
-    test_password = "SecurePassword123!"
-
-    # Clean up any existing user first by attempting login (which will fail if doesn't exist)
-    # Then register
-    register_response = client.post("/api/auth/register", json={
-        "email": test_email,
-        "password": test_password
-    })
-
-    assert register_response.status_code in [200, 409]  # 200 if new user, 409 if already exists
-
-    # Login to get token
-    login_response = client.post("/api/auth/login", json={
-        "email": test_email,
-        "password": test_password
-    })
-
-    assert login_response.status_code == 200
-    token_data = login_response.json()
-    auth_token = token_data["access_token"]
+    # Ensure the test user exists and grab a token (one register + one login)
+    auth_token = ensure_user(client, "test_sort_title_integration@example.com", "SecurePassword123!")
 
     # Make the request to the chat endpoint with the sort command
     headers = {"Authorization": f"Bearer {auth_token}"}
@@ -3,18 +3,26 @@ Acceptance test for "What is my email?" scenario
 Tests that authenticated users can ask the chatbot for their email address
 """
 import pytest
-import os
 from unittest.mock import AsyncMock, patch
 from fastapi.testclient import TestClient
-from fastapi import HTTPException
 
-from ai_chatbot.api.chat_endpoint import router
-from ai_chatbot.main import app
-from ai_chatbot.services.auth_validator import validate_auth_token
-from ai_chatbot.services.phase2_client import phase2_client
+# Skip at collection when the chatbot's service stack can't import (same
+# boundary as the ai_app fixture, which these tests all depend on)
+phase2_client = pytest.importorskip("ai_chatbot.services.phase2_client", exc_type=ImportError).phase2_client
 
 
-def test_what_is_my_email_scenario():
+@pytest.fixture(autouse=True, scope="module")
+def mock_get_user_info():
+    """Patch phase2_client.get_user_info once for the module.
+
+    Tests reassign .return_value instead of re-entering a patch context
+    per test.
+    """
+    with patch.object(phase2_client, 'get_user_info') as mock:
+        yield mock
+
+
+def test_what_is_my_email_scenario(ai_app, mock_get_user_info):
     """
     Acceptance Test: What is my email?
 
@@ -22,7 +30,7 @@ def test_what_is_my_email_scenario():
     When: user says "What is my email?"
     Then: the chatbot returns the user's email address
     """
-    client = TestClient(app)
+    client = TestClient(ai_app)
 
     # Mock authentication validation
     mock_user_id = "test-user-123"
@@ -36,33 +44,32 @@ def test_what_is_my_email_scenario():
     with patch('ai_chatbot.services.auth_validator.validate_auth_token') as mock_validate_auth:
         mock_validate_auth.return_value = AsyncMock(return_value=mock_user_id)
 
-        with patch.object(phase2_client, 'get_user_info') as mock_get_user_info:
-            mock_get_user_info.return_value = mock_user_info
+        mock_get_user_info.return_value = mock_user_info
 
-            # Send the request to the chat endpoint
-            headers = {
-                "Authorization": f"Bearer {mock_auth_token}",
-                "Content-Type": "application/json"
-            }
+        # Send the request to the chat endpoint
+        headers = {
+            "Authorization": f"Bearer {mock_auth_token}",
+            "Content-Type": "application/json"
+        }
 
-            payload = {
-                "message": "What is my email?",
-                "conversation_id": "test-conversation-123"
-            }
+        payload = {
+            "message": "What is my email?",
+            "conversation_id": "test-conversation-123"
+        }
 
-            response = client.post("/chat", json=payload, headers=headers)
+        response = client.post("/chat", json=payload, headers=headers)
 
-            # Assertions
-            assert response.status_code == 200
-            response_data = response.json()
+        # Assertions
+        assert response.status_code == 200
+        response_data = response.json()
 
-            # Check that the response contains the user's email
-            assert "test@example.com" in response_data["message"]
-            assert response_data["success"] is True
-            assert "email" in response_data["message"].lower()
+        # Check that the response contains the user's email
+        assert "test@example.com" in response_data["message"]
+        assert response_data["success"] is True
+        assert "email" in response_data["message"].lower()
 
 
-def test_who_am_i_scenario():
+def test_who_am_i_scenario(ai_app, mock_get_user_info):
     """
     Acceptance Test: Who am I?
 
@@ -70,7 +77,7 @@ def test_who_am_i_scenario():
     When: user says "Who am I?"
     Then: the chatbot confirms the user's identity
     """
-    client = TestClient(app)
+    client = TestClient(ai_app)
 
     # Mock authentication validation
     mock_user_id = "test-user-123"
@@ -84,32 +91,25 @@ def test_who_am_i_scenario():
     with patch('ai_chatbot.services.auth_validator.validate_auth_token') as mock_validate_auth:
         mock_validate_auth.return_value = AsyncMock(return_value=mock_user_id)
 
-        with patch.object(phase2_client, 'get_user_info') as mock_get_user_info:
-            mock_get_user_info.return_value = mock_user_info
-
-            # Send the request to the chat endpoint
-            headers = {
-                "Authorization": f"Bearer {mock_auth_token}",
-                "Content-Type": "application/json"
-            }
-
-            payload = {
-                "message": "Who am I?",
-                "conversation_id": "test-conversation-123"
-            }
+        mock_get_user_info.return_value = mock_user_info
 
-            response = client.post("/chat", json=payload, headers=headers)
+        # Send the request to the chat endpoint
+        headers = {
+            "Authorization": f"Bearer {mock_auth_token}",
+            "Content-Type": "application/json"
+        }
 
-            # Assertions
-            assert response.status_code == 200
-            response_data = response.json()
+        payload = {
+            "message": "Who am I?",
+            "conversation_id": "test-conversation-123"
+        }
 
-            # Check that the response confirms the user's identity
-            assert "test@example.com" in response_data["message"] or "Test User" in response_data["message"]
-            assert response_data["success"] is True
+        response = client.post("/chat", json=payload, headers=headers)
 
+        # Assertions
+        assert response.status_code == 200
+        response_data = response.json()
 
-if __name__ == "__main__":
-    test_what_is_my_email_scenario()
-    test_who_am_i_scenario()
-    print("Acceptance tests for user identity scenarios passed!")
\ No newline at end of file
+        # Check that the response confirms the user's identity
+        assert "test@example.com" in response_data["message"] or "Test User" in response_data["message"]
+        assert response_data["success"] is True
@@ -0,0 +1,141 @@
+import os
+import uuid
+
+import pytest
+import pytest_asyncio
+from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
+
+# Must be set before the app (and therefore db.py) is imported: the engine is
+# built at import time and switches to in-memory SQLite under TESTING.
+os.environ.setdefault("TESTING", "1")
+# Registration/login dominate test time at the production work factor; the
+# test database never outlives the run, so a single iteration is fine here.
+os.environ.setdefault("PBKDF2_ITERATIONS", "1")
+
+# Import the FastAPI apps once for the whole test run. Individual test modules
+# pull these in via the fixtures below instead of re-importing `main` (which
+# triggers router registration and DB engine setup) during collection.
+from main import app as main_app
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _create_tables():
+    """Create the schema once in the in-memory test database."""
+    from db import create_db_and_tables
+
+    create_db_and_tables()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _stub_dapr():
+    """Replace Dapr sidecar calls with instant no-ops for the whole session.
+
+    No sidecar listens on localhost:3500 in CI, so every publish/state call
+    would otherwise pay a connection-refused delay inside task tests.
+    """
+    from utils import events, state
+
+    async def _ok(*args, **kwargs):
+        return True
+
+    mp = pytest.MonkeyPatch()
+    mp.setattr(events.dapr_publisher, "publish_event", _ok)
+    mp.setattr(events.dapr_publisher, "publish_events_bulk", _ok)
+    mp.setattr(state.dapr_state_store, "save_state", _ok)
+    mp.setattr(state.dapr_state_store, "delete_state", _ok)
+    yield
+    mp.undo()
+
+
+@pytest.fixture
+def db_session():
+    """A session joined to an external transaction that is rolled back.
+
+    Everything written through this session during a test -- including
+    commits, which only release a SAVEPOINT that is transparently
+    restarted -- disappears at teardown, so tests need no cleanup code.
+    """
+    from sqlalchemy import event
+    from sqlmodel import Session
+
+    from db import engine
+
+    connection = engine.connect()
+    trans = connection.begin()
+    session = Session(bind=connection)
+    session.begin_nested()
+
+    @event.listens_for(session, "after_transaction_end")
+    def _restart_savepoint(sess, transaction):
+        if transaction.nested and not transaction._parent.nested:
+            sess.begin_nested()
+
+    yield session
+
+    session.close()
+    trans.rollback()
+    connection.close()
+
+
+@pytest.fixture
+def rollback_routes(app, db_session):
+    """Route all request DB work through the rolled-back db_session.
+
+    Modules opt in with a small autouse fixture; the override is removed
+    at teardown so other modules keep the real per-request sessions.
+    """
+    from db import get_session
+
+    app.dependency_overrides[get_session] = lambda: db_session
+    yield db_session
+    app.dependency_overrides.pop(get_session, None)
+
+
+@pytest.fixture(scope="session")
+def app():
+    """The main FastAPI application, shared across the test session."""
+    return main_app
+
+
+@pytest.fixture(scope="session")
+def client(app):
+    """A session-wide TestClient so the app lifespan runs once, not per test."""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest_asyncio.fixture(scope="session")
+async def aclient(app):
+    """In-process async client over ASGITransport, shared for the session.
+
+    Unlike TestClient, requests run directly on the session event loop
+    with no sync-to-async portal set up per call.
+    """
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def auth_token():
+    """A pre-minted JWT for tests that only need some valid bearer header.
+
+    Encoding the token directly is microseconds versus a full HTTP
+    register/login round trip, and avoids any auth endpoint traffic.
+    """
+    from auth import create_access_token
+
+    return create_access_token({"sub": str(uuid.uuid4())})
+
+
+@pytest.fixture(scope="session")
+def auth_headers(auth_token):
+    """Authorization headers built from the shared session token."""
+    return {"Authorization": f"Bearer {auth_token}"}
+
+
+@pytest.fixture(scope="session")
+def ai_app():
+    """The standalone AI chatbot application, shared across the test session."""
+    ai_main = pytest.importorskip("ai_chatbot.main")
+    return ai_main.app
@@ -1,17 +1,23 @@
+import uuid
+
 import pytest
 from fastapi.testclient import TestClient
-from main import app
-import json
+
+# Syntactically valid so the uuid.UUID path params parse and the requests
+# reach the auth check instead of 422ing
+_TASK_ID = str(uuid.uuid4())
 
 @pytest.fixture
-def client():
-    with TestClient(app) as test_client:
-        yield test_client
+def client(app):
+    # No context manager: these contract tests only assert 401 responses,
+    # so skipping lifespan startup (DB schema create, rate limiter init)
+    # saves that work per test
+    yield TestClient(app)
 
 def test_create_task_endpoint_contract(client):
     """Test that create task endpoint follows the expected contract"""
     # Test without authentication (should fail)
-    response = client.post("/tasks/", json={
+    response = client.post("/api/tasks/", json={
         "title": "Test task",
         "description": "Test description"
     })
@@ -22,7 +28,7 @@ def test_create_task_endpoint_contract(client):
 def test_get_tasks_endpoint_contract(client):
     """Test that get tasks endpoint follows the expected contract"""
     # Test without authentication (should fail)
-    response = client.get("/tasks/")
+    response = client.get("/api/tasks/")
 
     # Should return 401 without authentication
     assert response.status_code == 401
@@ -30,7 +36,7 @@ def test_get_tasks_endpoint_contract(client):
 def test_get_task_by_id_endpoint_contract(client):
     """Test that get task by ID endpoint follows the expected contract"""
     # Test without authentication (should fail)
-    response = client.get("/tasks/999")
+    response = client.get(f"/api/tasks/{_TASK_ID}")
 
     # Should return 401 without authentication
     assert response.status_code == 401
@@ -38,7 +44,7 @@ def test_get_task_by_id_endpoint_contract(client):
 def test_update_task_endpoint_contract(client):
     """Test that update task endpoint follows the expected contract"""
     # Test without authentication (should fail)
-    response = client.put("/tasks/999", json={
+    response = client.put(f"/api/tasks/{_TASK_ID}", json={
         "title": "Updated task",
         "description": "Updated description",
         "is_completed": True
@@ -50,41 +56,7 @@ def test_update_task_endpoint_contract(client):
 def test_delete_task_endpoint_contract(client):
     """Test that delete task endpoint follows the expected contract"""
     # Test without authentication (should fail)
-    response = client.delete("/tasks/999")
+    response = client.delete(f"/api/tasks/{_TASK_ID}")
 
     # Should return 401 without authentication
     assert response.status_code == 401
-
-def test_task_payload_structure(client):
-    """Test that task payload follows expected structure"""
-    # This is just a structural verification - would need valid auth to test fully
-    # We'll check the request/response structure expectations
-
-    # Expected create payload structure
-    expected_create_payload = {
-        "title": "string",
-        "description": "string (optional)"
-    }
-
-    # Expected response structure for task
-    expected_task_response = {
-        "id": "integer",
-        "title": "string",
-        "description": "string or null",
-        "is_completed": "boolean",
-        "user_id": "integer",
-        "created_at": "datetime string",
-        "updated_at": "datetime string"
-    }
-
-    # Expected update payload structure (partial update)
-    expected_update_payload = {
-        "title": "string (optional)",
-        "description": "string (optional)",
-        "is_completed": "boolean (optional)"
-    }
-
-    # These are just structural verifications - actual functionality tested elsewhere
-    assert isinstance(expected_create_payload, dict)
-    assert isinstance(expected_task_response, dict)
-    assert isinstance(expected_update_payload, dict)
\ No newline at end of file
@@ -0,0 +1,107 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _db_rollback(rollback_routes):
+    """Run every request in this module inside the rolled-back session."""
+
+
+@pytest.fixture
+def batch_user(client, _db_rollback):
+    """A registered user's auth headers; rolled back after each test."""
+    email = "batch_test_user@example.com"
+    password = "SecurePassword123!"
+    register_response = client.post("/api/auth/register", json={
+        "email": email,
+        "password": password,
+        "name": "Batch Test User"
+    })
+    assert register_response.status_code == 201
+    login_response = client.post("/api/auth/login", json={
+        "email": email,
+        "password": password
+    })
+    assert login_response.status_code == 200
+    token = login_response.json()["token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_batch_crud_sequence(client, batch_user):
+    """A create/update/complete/delete sequence succeeds in one request."""
+    operations = [
+        {"op": "create", "data": {"title": "Batch task", "description": "Created in batch"}},
+        {"op": "update", "data": {"title": "Batch task (updated)", "priority": "high"}},
+        {"op": "complete", "data": {"completed": True}},
+        {"op": "delete", "data": {}},
+    ]
+
+    response = client.post("/api/tasks/batch", json=operations, headers=batch_user)
+    assert response.status_code == 200
+
+    results = response.json()["results"]
+    assert len(results) == 4
+    created, updated, completed, deleted = results
+    assert created["title"] == "Batch task"
+    assert updated["title"] == "Batch task (updated)"
+    assert updated["priority"] == "high"
+    assert completed["completed"] is True
+    # Operations without task_id target the task created earlier in the batch
+    assert deleted == {"deleted": created["id"]}
+
+    # The task is really gone
+    list_response = client.get("/api/tasks", headers=batch_user)
+    assert list_response.status_code == 200
+    assert all(task["id"] != created["id"] for task in list_response.json()["tasks"])
+
+
+def test_batch_invalid_data_reports_per_op_error(client, batch_user):
+    """Malformed operation data yields an error result, not a 500."""
+    operations = [
+        {"op": "create", "data": {"description": 5}},
+        {"op": "update", "data": {"priority": ["not", "a", "string"]}},
+        {"op": "create", "data": {"title": "Valid after invalid"}},
+    ]
+
+    response = client.post("/api/tasks/batch", json=operations, headers=batch_user)
+    assert response.status_code == 200
+
+    results = response.json()["results"]
+    assert "error" in results[0]
+    assert "error" in results[1]
+    # A bad operation must not poison the rest of the batch
+    assert results[2]["title"] == "Valid after invalid"
+
+
+def test_batch_update_enforces_put_validation(client, batch_user):
+    """Batch updates apply the same semantic checks as the PUT route."""
+    operations = [
+        {"op": "create", "data": {"title": "Validation target"}},
+        {"op": "update", "data": {"title": "   "}},
+        {"op": "update", "data": {"priority": "urgent"}},
+        {"op": "update", "data": {"title": "Still valid", "priority": "low"}},
+    ]
+
+    response = client.post("/api/tasks/batch", json=operations, headers=batch_user)
+    assert response.status_code == 200
+
+    results = response.json()["results"]
+    assert results[1] == {"error": "Title is required"}
+    assert results[2] == {"error": "Priority must be 'low', 'medium', or 'high'"}
+    # Rejected updates must not be applied
+    assert results[3]["title"] == "Still valid"
+    assert results[3]["priority"] == "low"
+
+
+def test_batch_unknown_op_and_missing_task(client, batch_user):
+    """Unknown ops and absent targets report errors in-place."""
+    operations = [
+        {"op": "rename", "data": {"title": "Nope"}},
+        {"op": "delete", "data": {}},
+    ]
+
+    response = client.post("/api/tasks/batch", json=operations, headers=batch_user)
+    assert response.status_code == 200
+
+    results = response.json()["results"]
+    assert results[0] == {"error": "Unknown operation 'rename'"}
+    assert results[1] == {"error": "Task not found"}
@@ -1,15 +1,48 @@
+import logging
+import time
 import uuid
-import json
-from datetime import datetime
-from typing import Dict, Any, Optional
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Optional
 import httpx
+import orjson
 import asyncio
 from fastapi import HTTPException
 import os
 
+logger = logging.getLogger(__name__)
+
+# Success statuses from the sidecar; bodies on success are empty
+_OK = frozenset({200, 204})
+
 # Get DAPR_HTTP_PORT from environment, default to 3500
 DAPR_HTTP_PORT = os.getenv("DAPR_HTTP_PORT", "3500")
 
+# Unix domain socket to the sidecar, used instead of TCP loopback when present
+DAPR_UDS_PATH = os.getenv("DAPR_UDS_PATH", "/var/run/dapr/dapr.sock")
+
+def dapr_transport() -> "httpx.AsyncHTTPTransport":
+    """
+    Transport to the Dapr sidecar: the Unix domain socket when it exists
+    (skips TCP loopback entirely), falling back to TCP. HTTP/2 is enabled
+    either way so concurrent calls multiplex over one connection
+    """
+    limits = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+    if os.path.exists(DAPR_UDS_PATH):
+        return httpx.AsyncHTTPTransport(uds=DAPR_UDS_PATH, http2=True, limits=limits)
+    return httpx.AsyncHTTPTransport(http2=True, limits=limits)
+
+# 1ms-resolution timestamp cache: events produced within the same tick share
+# one formatted string instead of each allocating and formatting a datetime
+_TIME_CACHE = {"t": 0.0, "s": ""}
+
+def _now_iso() -> str:
+    """Current UTC time in ISO format, cached at millisecond resolution"""
+    t = time.time()
+    if t - _TIME_CACHE["t"] > 0.001:
+        _TIME_CACHE["t"] = t
+        _TIME_CACHE["s"] = datetime.fromtimestamp(t, tz=timezone.utc).isoformat()
+    return _TIME_CACHE["s"]
+
 class DaprEventPublisher:
     """
     Utility class for publishing events to Dapr pub/sub component
@@ -18,8 +51,105 @@ class DaprEventPublisher:
     def __init__(self, dapr_http_port: str = DAPR_HTTP_PORT):
         self.dapr_http_port = dapr_http_port
         self.dapr_base_url = f"http://localhost:{self.dapr_http_port}"
-        
-    async def publish_event(self, topic: str, data: Dict[str, Any], event_type: str = "custom", 
+        # Request paths joined once instead of re-interpolated per publish
+        self._publish_path_fmt = "/v1.0/publish/pubsub/{}"
+        self._bulk_publish_path_fmt = "/v1.0-alpha1/publish/bulk/pubsub/{}"
+        # Constant CloudEvent fields, built once instead of per publish
+        self._base_event = {
+            "specversion": "1.0",
+            "datacontenttype": "application/json"
+        }
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_lock = asyncio.Lock()
+        self._queue: Optional["asyncio.Queue"] = None
+        self._worker_task: Optional["asyncio.Task"] = None
+
+    def start_worker(self) -> None:
+        """Start the background publish worker (called at application startup)"""
+        if self._worker_task is None or self._worker_task.done():
+            # The queue must be created here, not in __init__: an
+            # asyncio.Queue binds to the running event loop, and each
+            # lifespan (uvicorn reloads, test runs) starts a fresh loop
+            self._queue = asyncio.Queue(maxsize=10000)
+            self._worker_task = asyncio.create_task(self._worker())
+
+    async def _worker(self) -> None:
+        """Drain queued events and publish them off the request hot path"""
+        while True:
+            topic, data, event_type, source = await self._queue.get()
+            try:
+                await self.publish_event(topic, data, event_type, source)
+            finally:
+                self._queue.task_done()
+
+    def publish_nowait(self, topic: str, data: Dict[str, Any], event_type: str = "custom",
+                       source: str = "/backend/tasks") -> bool:
+        """
+        Enqueue an event for the background worker without waiting for the
+        sidecar round trip
+
+        Returns:
+            bool: True if the event was queued, False when it could not be
+            (no running worker, or the buffer is full) and the caller should
+            publish inline instead
+        """
+        if self._worker_task is None or self._worker_task.done() or self._queue is None:
+            return False
+        try:
+            self._queue.put_nowait((topic, data, event_type, source))
+            return True
+        except asyncio.QueueFull:
+            return False
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """
+        Lazily create a single shared HTTP client so publishes reuse
+        keep-alive connections to the sidecar instead of paying connection
+        setup per event
+        """
+        if self._client is None:
+            async with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.AsyncClient(
+                        base_url=self.dapr_base_url,
+                        transport=dapr_transport(),
+                        timeout=5.0,
+                        headers={"Content-Type": "application/json"}
+                    )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Flush pending events and close the shared HTTP client (called at application shutdown)"""
+        if self._worker_task is not None:
+            if not self._worker_task.done() and self._queue is not None:
+                # Drain the queue, but stop waiting if the worker dies with
+                # items still queued -- join() alone would hang shutdown
+                join = asyncio.ensure_future(self._queue.join())
+                await asyncio.wait({join, self._worker_task},
+                                   return_when=asyncio.FIRST_COMPLETED)
+                if not join.done():
+                    join.cancel()
+            self._worker_task.cancel()
+            self._worker_task = None
+            self._queue = None
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _build_event(self, data: Dict[str, Any], event_type: str = "custom",
+                     source: str = "/backend/tasks") -> Dict[str, Any]:
+        """Build a CloudEvent compliant payload for the given data"""
+        return {
+            **self._base_event,
+            "type": event_type,
+            "source": source,
+            # hex form skips dash formatting; Dapr only needs uniqueness
+            "id": uuid.uuid4().hex,
+            "time": _now_iso(),
+            "data": data
+        }
+
+    async def publish_event(self, topic: str, data: Dict[str, Any], event_type: str = "custom",
                            source: str = "/backend/tasks") -> bool:
         """
         Publish an event to a Dapr pub/sub topic
@@ -35,41 +165,120 @@ class DaprEventPublisher:
         """
         try:
             # Create CloudEvent compliant payload
-            event_payload = {
-                "specversion": "1.0",
-                "type": event_type,
-                "source": source,
-                "id": str(uuid.uuid4()),
-                "time": datetime.utcnow().isoformat() + "Z",
-                "datacontenttype": "application/json",
-                "data": data
-            }
-            
-            # Construct the URL for publishing to the pubsub component
-            url = f"{self.dapr_base_url}/v1.0/publish/pubsub/{topic}"
-            
-            # Publish the event using httpx
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    url=url,
-                    json=event_payload,
-                    headers={"Content-Type": "application/json"}
-                )
-                
-                if response.status_code == 200:
-                    print(f"Dapr event published successfully to topic '{topic}'")
-                    return True
-                else:
-                    print(f"Failed to publish Dapr event to topic '{topic}'. Status: {response.status_code}, Response: {response.text}")
-                    return False
-                    
+            event_payload = self._build_event(data, event_type, source)
+
+
+            # Publish the event through the shared client
+            client = await self._get_client()
+            response = await client.post(
+                self._publish_path_fmt.format(topic),
+                content=orjson.dumps(event_payload),
+                headers={"Content-Type": "application/cloudevents+json"}
+            )
+
+            if response.status_code in _OK:
+                logger.debug("Dapr event published successfully to topic '%s'", topic)
+                return True
+
+            logger.warning("Failed to publish Dapr event to topic '%s'. Status: %s",
+                           topic, response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                # Only materialize (a slice of) the error body when debugging
+                logger.debug("Dapr error body: %s", response.content[:512])
+            return False
+
         except Exception as e:
-            print(f"Error publishing Dapr event to topic '{topic}': {str(e)}")
+            logger.warning("Error publishing Dapr event to topic '%s': %s", topic, e)
+            return False
+
+    async def publish_events_bulk(self, topic: str, events: List[Dict[str, Any]]) -> bool:
+        """
+        Publish multiple CloudEvents to a topic with a single bulkPublish call
+
+        Args:
+            topic: The topic name to publish to (e.g., "task.updated")
+            events: CloudEvent payloads built with _build_event
+
+        Returns:
+            bool: True if all events were published successfully, False otherwise
+        """
+        try:
+            entries = [
+                {
+                    "entryId": uuid.uuid4().hex,
+                    "event": event,
+                    "contentType": "application/cloudevents+json"
+                }
+                for event in events
+            ]
+
+            client = await self._get_client()
+            response = await client.post(
+                self._bulk_publish_path_fmt.format(topic),
+                content=orjson.dumps(entries)
+            )
+
+            if response.status_code in _OK:
+                logger.debug("Dapr bulk publish of %d events to topic '%s' succeeded",
+                             len(entries), topic)
+                return True
+
+            logger.warning("Failed to bulk publish Dapr events to topic '%s'. Status: %s",
+                           topic, response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Dapr error body: %s", response.content[:512])
+            return False
+
+        except Exception as e:
+            logger.warning("Error bulk publishing Dapr events to topic '%s': %s", topic, e)
             return False
 
 # Global instance of the publisher
 dapr_publisher = DaprEventPublisher()
 
+
+class EventBatch:
+    """
+    Collects events across a request and flushes them per-topic in bulk,
+    collapsing N sidecar round trips into one per topic
+
+    Usage:
+        async with EventBatch() as batch:
+            batch.add("task.updated", data, "task.updated")
+            batch.add("task.completed", other_data, "task.completed")
+    """
+
+    def __init__(self, publisher: Optional[DaprEventPublisher] = None):
+        self.publisher = publisher or dapr_publisher
+        self._events: Dict[str, list] = {}
+
+    def add(self, topic: str, data: Dict[str, Any], event_type: str = "custom",
+            source: str = "/backend/tasks") -> None:
+        """Queue an event for the given topic"""
+        self._events.setdefault(topic, []).append(
+            self.publisher._build_event(data, event_type, source)
+        )
+
+    async def flush(self) -> bool:
+        """Publish all queued events, one bulk call per topic"""
+        ok = True
+        for topic, events in self._events.items():
+            if len(events) == 1:
+                # Single event: the regular publish endpoint is enough
+                event = events[0]
+                ok = await self.publisher.publish_event(topic, event["data"], event["type"], event["source"]) and ok
+            else:
+                ok = await self.publisher.publish_events_bulk(topic, events) and ok
+        self._events.clear()
+        return ok
+
+    async def __aenter__(self) -> "EventBatch":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            await self.flush()
+
 # Convenience functions for specific task events
 async def publish_task_created_event(task_id: str, user_id: str, title: str, description: Optional[str] = None) -> bool:
     """Publish a task.created event"""
@@ -77,9 +286,10 @@ async def publish_task_created_event(task_id: str, user_id: str, title: str, des
         "task_id": task_id,
         "user_id": user_id,
         "title": title,
-        "description": description,
-        "timestamp": datetime.utcnow().isoformat()
+        "description": description
     }
+    if dapr_publisher.publish_nowait("task.created", data, "task.created"):
+        return True
     return await dapr_publisher.publish_event("task.created", data, "task.created")
 
 async def publish_task_updated_event(task_id: str, user_id: str, updated_fields: Dict[str, Any]) -> bool:
@@ -87,18 +297,20 @@ async def publish_task_updated_event(task_id: str, user_id: str, updated_fields:
     data = {
         "task_id": task_id,
         "user_id": user_id,
-        "updated_fields": updated_fields,
-        "timestamp": datetime.utcnow().isoformat()
+        "updated_fields": updated_fields
     }
+    if dapr_publisher.publish_nowait("task.updated", data, "task.updated"):
+        return True
     return await dapr_publisher.publish_event("task.updated", data, "task.updated")
 
 async def publish_task_deleted_event(task_id: str, user_id: str) -> bool:
     """Publish a task.deleted event"""
     data = {
         "task_id": task_id,
-        "user_id": user_id,
-        "timestamp": datetime.utcnow().isoformat()
+        "user_id": user_id
     }
+    if dapr_publisher.publish_nowait("task.deleted", data, "task.deleted"):
+        return True
     return await dapr_publisher.publish_event("task.deleted", data, "task.deleted")
 
 async def publish_task_completed_event(task_id: str, user_id: str, completed: bool) -> bool:
@@ -106,7 +318,8 @@ async def publish_task_completed_event(task_id: str, user_id: str, completed: bo
     data = {
         "task_id": task_id,
         "user_id": user_id,
-        "completed": completed,
-        "timestamp": datetime.utcnow().isoformat()
+        "completed": completed
     }
+    if dapr_publisher.publish_nowait("task.completed", data, "task.completed"):
+        return True
     return await dapr_publisher.publish_event("task.completed", data, "task.completed")
\ No newline at end of file
@@ -1,8 +1,17 @@
-import json
+import asyncio
+import logging
 import httpx
-from typing import Any, Dict, Optional
+import orjson
+from typing import Any, Dict, List, Optional, Tuple
 import os
 
+from utils.events import dapr_transport
+
+logger = logging.getLogger(__name__)
+
+# Success statuses from the sidecar; bodies on success are empty
+_OK = frozenset({200, 204})
+
 # Get DAPR_HTTP_PORT from environment, default to 3500
 DAPR_HTTP_PORT = os.getenv("DAPR_HTTP_PORT", "3500")
 
@@ -15,7 +24,37 @@ class DaprStateStore:
         self.dapr_http_port = dapr_http_port
         self.dapr_base_url = f"http://localhost:{self.dapr_http_port}"
         self.state_store_name = state_store_name
-        
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_lock = asyncio.Lock()
+        # Request paths joined once instead of re-interpolated per call
+        self._state_path = f"/v1.0/state/{self.state_store_name}"
+        self._item_path_fmt = self._state_path + "/{}"
+        self._bulk_path = self._state_path + "/bulk"
+        self._transaction_path = self._state_path + "/transaction"
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """
+        Lazily create a single shared HTTP client so state operations reuse
+        keep-alive connections to the sidecar instead of paying connection
+        setup per call
+        """
+        if self._client is None:
+            async with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.AsyncClient(
+                        base_url=self.dapr_base_url,
+                        transport=dapr_transport(),
+                        timeout=5.0,
+                        headers={"Content-Type": "application/json"}
+                    )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client (called at application shutdown)"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
     async def save_state(self, key: str, value: Any, ttl_in_seconds: Optional[int] = None) -> bool:
         """
         Save state to Dapr state store
@@ -41,26 +80,26 @@ class DaprStateStore:
                     "ttlInSeconds": str(ttl_in_seconds)
                 }
             
-            # Construct the URL for saving to the state store
-            url = f"{self.dapr_base_url}/v1.0/state/{self.state_store_name}"
-            
-            # Save the state using httpx
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    url=url,
-                    json=[state_entry],  # Dapr expects an array of state entries
-                    headers={"Content-Type": "application/json"}
-                )
-                
-                if response.status_code in [200, 204]:
-                    print(f"Dapr state saved successfully with key '{key}'")
-                    return True
-                else:
-                    print(f"Failed to save Dapr state with key '{key}'. Status: {response.status_code}, Response: {response.text}")
-                    return False
-                    
+            # Save the state through the shared client
+            client = await self._get_client()
+            response = await client.post(
+                self._state_path,
+                content=orjson.dumps([state_entry])  # Dapr expects an array of state entries
+            )
+
+            if response.status_code in _OK:
+                logger.debug("Dapr state saved successfully with key '%s'", key)
+                return True
+
+            logger.warning("Failed to save Dapr state with key '%s'. Status: %s",
+                           key, response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                # Only materialize (a slice of) the error body when debugging
+                logger.debug("Dapr error body: %s", response.content[:512])
+            return False
+
         except Exception as e:
-            print(f"Error saving Dapr state with key '{key}': {str(e)}")
+            logger.warning("Error saving Dapr state with key '%s': %s", key, e)
             return False
     
     async def get_state(self, key: str) -> Optional[Any]:
@@ -74,25 +113,25 @@ class DaprStateStore:
             The state value if found, None otherwise
         """
         try:
-            # Construct the URL for getting from the state store
-            url = f"{self.dapr_base_url}/v1.0/state/{self.state_store_name}/{key}"
-            
-            # Get the state using httpx
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url=url)
-                
-                if response.status_code == 200:
-                    print(f"Dapr state retrieved successfully with key '{key}'")
-                    return response.json()
-                elif response.status_code == 404:
-                    print(f"Dapr state not found with key '{key}'")
-                    return None
-                else:
-                    print(f"Failed to get Dapr state with key '{key}'. Status: {response.status_code}, Response: {response.text}")
-                    return None
-                    
+            # Get the state through the shared client
+            client = await self._get_client()
+            response = await client.get(self._item_path_fmt.format(key))
+
+            if response.status_code == 200:
+                logger.debug("Dapr state retrieved successfully with key '%s'", key)
+                return response.json()
+            if response.status_code == 404:
+                logger.debug("Dapr state not found with key '%s'", key)
+                return None
+
+            logger.warning("Failed to get Dapr state with key '%s'. Status: %s",
+                           key, response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Dapr error body: %s", response.content[:512])
+            return None
+
         except Exception as e:
-            print(f"Error getting Dapr state with key '{key}': {str(e)}")
+            logger.warning("Error getting Dapr state with key '%s': %s", key, e)
             return None
     
     async def delete_state(self, key: str) -> bool:
@@ -106,22 +145,133 @@ class DaprStateStore:
             bool: True if state was deleted successfully, False otherwise
         """
         try:
-            # Construct the URL for deleting from the state store
-            url = f"{self.dapr_base_url}/v1.0/state/{self.state_store_name}/{key}"
-            
-            # Delete the state using httpx
-            async with httpx.AsyncClient() as client:
-                response = await client.delete(url=url)
-                
-                if response.status_code in [200, 204]:
-                    print(f"Dapr state deleted successfully with key '{key}'")
-                    return True
-                else:
-                    print(f"Failed to delete Dapr state with key '{key}'. Status: {response.status_code}, Response: {response.text}")
-                    return False
-                    
+            # Delete the state through the shared client
+            client = await self._get_client()
+            response = await client.delete(self._item_path_fmt.format(key))
+
+            if response.status_code in _OK:
+                logger.debug("Dapr state deleted successfully with key '%s'", key)
+                return True
+
+            logger.warning("Failed to delete Dapr state with key '%s'. Status: %s",
+                           key, response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Dapr error body: %s", response.content[:512])
+            return False
+
         except Exception as e:
-            print(f"Error deleting Dapr state with key '{key}': {str(e)}")
+            logger.warning("Error deleting Dapr state with key '%s': %s", key, e)
+            return False
+
+    async def save_states(self, entries: List[Tuple[str, Any, Optional[int]]]) -> bool:
+        """
+        Save multiple state entries with a single request
+
+        Args:
+            entries: (key, value, ttl_in_seconds) tuples; ttl may be None
+
+        Returns:
+            bool: True if all entries were saved successfully, False otherwise
+        """
+        try:
+            state_entries = []
+            for key, value, ttl_in_seconds in entries:
+                state_entry = {
+                    "key": key,
+                    "value": value
+                }
+                if ttl_in_seconds is not None:
+                    state_entry["metadata"] = {
+                        "ttlInSeconds": str(ttl_in_seconds)
+                    }
+                state_entries.append(state_entry)
+
+            client = await self._get_client()
+            response = await client.post(
+                self._state_path,
+                content=orjson.dumps(state_entries)
+            )
+
+            if response.status_code in _OK:
+                logger.debug("Dapr bulk save of %d state entries succeeded", len(state_entries))
+                return True
+
+            logger.warning("Failed to bulk save Dapr state. Status: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Dapr error body: %s", response.content[:512])
+            return False
+
+        except Exception as e:
+            logger.warning("Error bulk saving Dapr state: %s", e)
+            return False
+
+    async def get_states(self, keys: List[str], parallelism: int = 10) -> Dict[str, Optional[Any]]:
+        """
+        Get multiple state entries with a single bulk request
+
+        Args:
+            keys: The state keys to fetch
+            parallelism: How many keys the sidecar may fetch concurrently
+
+        Returns:
+            Dict mapping each requested key to its value (None when missing)
+        """
+        try:
+            client = await self._get_client()
+            response = await client.post(
+                self._bulk_path,
+                content=orjson.dumps({"keys": keys, "parallelism": parallelism})
+            )
+
+            if response.status_code == 200:
+                logger.debug("Dapr bulk get of %d state keys succeeded", len(keys))
+                items = {item["key"]: item.get("data") for item in response.json()}
+                return {key: items.get(key) for key in keys}
+
+            logger.warning("Failed to bulk get Dapr state. Status: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Dapr error body: %s", response.content[:512])
+            return {key: None for key in keys}
+
+        except Exception as e:
+            logger.warning("Error bulk getting Dapr state: %s", e)
+            return {key: None for key in keys}
+
+    async def delete_states(self, keys: List[str]) -> bool:
+        """
+        Delete multiple state entries with a single transaction request
+
+        Args:
+            keys: The state keys to delete
+
+        Returns:
+            bool: True if all entries were deleted successfully, False otherwise
+        """
+        try:
+            transaction = {
+                "operations": [
+                    {"operation": "delete", "request": {"key": key}}
+                    for key in keys
+                ]
+            }
+
+            client = await self._get_client()
+            response = await client.post(
+                self._transaction_path,
+                content=orjson.dumps(transaction)
+            )
+
+            if response.status_code in _OK:
+                logger.debug("Dapr bulk delete of %d state keys succeeded", len(keys))
+                return True
+
+            logger.warning("Failed to bulk delete Dapr state. Status: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Dapr error body: %s", response.content[:512])
+            return False
+
+        except Exception as e:
+            logger.warning("Error bulk deleting Dapr state: %s", e)
             return False
 
 # Global instance of the state store
@@ -153,6 +303,14 @@ async def get_user_cache(user_id: str) -> Optional[Dict[str, Any]]:
     key = f"cache:user:{user_id}"
     return await dapr_state_store.get_state(key)
 
+async def save_user_caches_bulk(user_data_by_id: Dict[str, Dict[str, Any]], ttl_in_seconds: int = 1800) -> bool:
+    """Save several users' cache entries in a single bulk request"""
+    entries = [
+        (f"cache:user:{user_id}", user_data, ttl_in_seconds)
+        for user_id, user_data in user_data_by_id.items()
+    ]
+    return await dapr_state_store.save_states(entries)
+
 async def save_task_list_cache(user_id: str, task_list: list, ttl_in_seconds: int = 300) -> bool:
     """Save task list to cache in Dapr state store"""
     key = f"cache:tasks:{user_id}"
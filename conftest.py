@@ -0,0 +1,43 @@
+from datetime import datetime, timedelta
+
+import httpx
+import orjson
+import pytest_asyncio
+
+from test_api import TASKS_URL, TIMEOUT, auth_flow, make_transport, request_with_backoff
+
+
+@pytest_asyncio.fixture(scope="session")
+async def auth_client():
+    """An authenticated client shared by every test in the session.
+
+    Registration and login (the expensive steps) run exactly once; the
+    bearer token is set as a default header so tests just make calls.
+    """
+    async with httpx.AsyncClient(
+        transport=make_transport(), timeout=TIMEOUT,
+        headers={"Content-Type": "application/json"}
+    ) as client:
+        token, _email = await auth_flow(client)
+        assert token, "authentication against the live API failed"
+        client.headers["Authorization"] = f"Bearer {token}"
+        yield client
+
+
+@pytest_asyncio.fixture(scope="session")
+async def task_id(auth_client):
+    """One task created up front for the CRUD tests to exercise."""
+    due_date = (datetime.now() + timedelta(days=7)).isoformat()
+    response = await request_with_backoff(
+        auth_client, "POST", TASKS_URL,
+        content=orjson.dumps({
+            "title": "Test task with due date",
+            "description": "This is a test task",
+            "priority": "medium",
+            "category": "work",
+            "due_date": due_date,
+            "recurrence_pattern": "weekly",
+        }),
+    )
+    assert response.status_code == 201, response.text
+    return orjson.loads(response.content)["id"]